@@ -1,6 +1,25 @@
 # noqa
-from .fw import FreeWili  # noqa
+from typing import TYPE_CHECKING, Any
+
 from .serialport import TRACE, configure_logging, enable_trace_logging  # noqa
 
+if TYPE_CHECKING:
+    from .fw import FreeWili  # noqa
+
+__all__ = ["FreeWili", "TRACE", "configure_logging", "enable_trace_logging"]
+
 # Configure logging automatically when freewili package is imported
 configure_logging()
+
+
+def __getattr__(name: str) -> Any:
+    # FreeWili pulls in pyfwfinder and the serial stack, defer it until used so CLI start up stays fast.
+    if name == "FreeWili":
+        from .fw import FreeWili
+
+        return FreeWili
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,16 +4,26 @@ This module provides a command line interface to find and control FreeWili board
 """
 
 import argparse
-import importlib.metadata
-import pathlib
+from typing import Any
 
-import pyfwfinder as fwf
-from result import Err, Ok
 
-from freewili import FreeWili
-from freewili.cli import exit_with_error, get_device
-from freewili.fw_serial import FreeWiliProcessorType, FreeWiliSerial, IOMenuCommand
-from freewili.types import GPIO_MAP
+class _VersionAction(argparse.Action):
+    """Print the freewili package version and exit, reading package metadata only when requested."""
+
+    def __init__(self, option_strings: list[str], dest: str = argparse.SUPPRESS, help: str | None = None) -> None:
+        super().__init__(option_strings=option_strings, dest=dest, default=argparse.SUPPRESS, nargs=0, help=help)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        import importlib.metadata
+
+        print(f"{parser.prog} {importlib.metadata.version('freewili')}")
+        parser.exit()
 
 
 def main() -> None:
@@ -157,10 +167,20 @@ def main() -> None:
     )
     parser.add_argument(
         "--version",
-        action="version",
-        version="%(prog)s {version}".format(version=importlib.metadata.version("freewili")),
+        action=_VersionAction,
+        help="show program's version number and exit",
     )
     args = parser.parse_args()
+
+    # Deferred so --help and --version don't pay for loading the USB and serial stacks.
+    import pyfwfinder as fwf
+    from result import Err, Ok
+
+    from freewili import FreeWili
+    from freewili.cli import exit_with_error, get_device
+    from freewili.fw_serial import FreeWiliProcessorType, FreeWiliSerial, IOMenuCommand
+    from freewili.types import GPIO_MAP
+
     device_index: int = args.index - 1
     processor_type = None
     if args.main_index is not None:
@@ -220,89 +240,83 @@ def main() -> None:
                     print_verbose(free_wili.fpga, None)
             finally:
                 free_wili.close()
+    selected: None | FreeWili = None
+
+    def selected_device() -> FreeWili:
+        # Look up the selected FreeWili on first use and share it between all the requested actions.
+        nonlocal selected
+        if selected is None:
+            device_result = get_device(device_index, devices)
+            if device_result.is_err():
+                exit_with_error(device_result.unwrap_err())
+            selected = device_result.unwrap()
+        return selected
+
     if args.send_file:
 
         def send_file_callback(msg: str) -> None:
             if args.verbose:
                 print(msg)
 
-        match get_device(device_index, devices):
-            case Ok(device):
-                file_name = None
-                if args.file_name:
-                    file_name = args.file_name[0]
-                match device.send_file(args.send_file[0], file_name, processor_type, send_file_callback):
-                    case Ok(msg):
-                        print(f"Success: {msg}")
-                    case Err(msg):
-                        exit_with_error(msg)
-                    case _:
-                        exit_with_error("Missing case statement")
+        file_name = None
+        if args.file_name:
+            file_name = args.file_name[0]
+        match selected_device().send_file(args.send_file[0], file_name, processor_type, send_file_callback):
+            case Ok(msg):
+                print(f"Success: {msg}")
             case Err(msg):
                 exit_with_error(msg)
+            case _:
+                exit_with_error("Missing case statement")
     if args.get_file:
 
         def get_file_callback(msg: str) -> None:
             if args.verbose:
                 print(msg)
 
-        match get_device(device_index, devices):
-            case Ok(device):
-                match device.get_file(args.get_file[0], args.get_file[1], processor_type, get_file_callback):
-                    case Ok(msg):
-                        print(f"Success: {msg}")
-                    case Err(msg):
-                        exit_with_error(msg)
-                    case _:
-                        exit_with_error("Missing case statement")
+        match selected_device().get_file(args.get_file[0], args.get_file[1], processor_type, get_file_callback):
+            case Ok(msg):
+                print(f"Success: {msg}")
             case Err(msg):
                 exit_with_error(msg)
+            case _:
+                exit_with_error("Missing case statement")
     if args.stop_script:
-        match get_device(device_index, devices):
-            case Ok(device):
-                print("Stopping any running scripts...")
-                match device.stop_script():
-                    case Ok(msg):
-                        print(f"Successfully stopped scripts: {msg}")
-                    case Err(msg):
-                        exit_with_error(f"Failed to stop scripts: {msg}")
-                    case _:
-                        raise RuntimeError("Missing case statement")
+        print("Stopping any running scripts...")
+        match selected_device().stop_script():
+            case Ok(msg):
+                print(f"Successfully stopped scripts: {msg}")
             case Err(msg):
-                exit_with_error(msg)
+                exit_with_error(f"Failed to stop scripts: {msg}")
+            case _:
+                raise RuntimeError("Missing case statement")
     if args.run_script is not None:
-        match get_device(device_index, devices):
-            case Ok(device):
-                if args.run_script:
-                    script_name = args.run_script
-                elif args.file_name:
-                    script_name = args.file_name[0]
-                elif args.send_file:
-                    script_name = pathlib.Path(args.send_file[0]).name
-                else:
-                    raise ValueError("No script or file name provided")
-                print(f"Running script {script_name}...")
-                match device.run_script(script_name, True):
-                    case Ok(msg):
-                        print(f"Successfully ran script {script_name}: {msg}")
-                    case Err(msg):
-                        print(f"Failed to run script {script_name}: {msg}")
-                    case _:
-                        raise RuntimeError("Missing case statement")
+        if args.run_script:
+            script_name = args.run_script
+        elif args.file_name:
+            script_name = args.file_name[0]
+        elif args.send_file:
+            import pathlib
+
+            script_name = pathlib.Path(args.send_file[0]).name
+        else:
+            raise ValueError("No script or file name provided")
+        print(f"Running script {script_name}...")
+        match selected_device().run_script(script_name, True):
+            case Ok(msg):
+                print(f"Successfully ran script {script_name}: {msg}")
             case Err(msg):
-                exit_with_error(msg)
+                print(f"Failed to run script {script_name}: {msg}")
+            case _:
+                raise RuntimeError("Missing case statement")
     if args.io is not None:
         io_args_length = len(args.io)
         if io_args_length == 0:
-            match get_device(device_index, devices):
-                case Ok(device):
-                    print("Getting IO pin values...")
-                    match device.get_io():
-                        case Ok(values):
-                            for io_num, io_name in GPIO_MAP.items():
-                                print(f"{io_name}: {values[io_num]}")
-                        case Err(msg):
-                            exit_with_error(msg)
+            print("Getting IO pin values...")
+            match selected_device().get_io():
+                case Ok(values):
+                    for io_num, io_name in GPIO_MAP.items():
+                        print(f"{io_name}: {values[io_num]}")
                 case Err(msg):
                     exit_with_error(msg)
         else:
@@ -316,125 +330,85 @@ def main() -> None:
                     exit_with_error(f"Expected 4 parameters to -io, got {io_args_length}")
                 pwm_freq_hz = int(args.io[2])
                 pwm_duty_cycle = int(args.io[3])
-            match get_device(device_index, devices):
-                case Ok(device):
-                    print(f"Setting IO pin {io_pin} {menu_cmd.name} ", end="")
-                    if io_args_length >= 4:
-                        print(f"PWM Frequency: {pwm_freq_hz}Hz {pwm_duty_cycle}%", end="")
-                    print()
-                    match device.set_io(io_pin, menu_cmd, pwm_freq_hz, pwm_duty_cycle):
-                        case Ok(msg):
-                            print(f"Successfully configured pin {io_pin} {menu_cmd.name}: {msg}")
-                        case Err(msg):
-                            exit_with_error("Failed to configure IO pin: {msg}")
+            print(f"Setting IO pin {io_pin} {menu_cmd.name} ", end="")
+            if io_args_length >= 4:
+                print(f"PWM Frequency: {pwm_freq_hz}Hz {pwm_duty_cycle}%", end="")
+            print()
+            match selected_device().set_io(io_pin, menu_cmd, pwm_freq_hz, pwm_duty_cycle):
+                case Ok(msg):
+                    print(f"Successfully configured pin {io_pin} {menu_cmd.name}: {msg}")
                 case Err(msg):
-                    exit_with_error(msg)
+                    exit_with_error("Failed to configure IO pin: {msg}")
     if args.led:
         led_num = args.led[0]
         red = args.led[1]
         green = args.led[2]
         blue = args.led[3]
-        match get_device(device_index, devices):
-            case Ok(device):
-                print(f"Setting LED {led_num} to RGB: {red}, {green}, {blue}...")
-                match device.set_board_leds(led_num, red, green, blue):
-                    case Ok(msg):
-                        print(f"Successfully set LED {led_num}: {msg}")
-                    case Err(msg):
-                        exit_with_error(msg)
-                    case _:
-                        raise RuntimeError("Missing case statement")
+        print(f"Setting LED {led_num} to RGB: {red}, {green}, {blue}...")
+        match selected_device().set_board_leds(led_num, red, green, blue):
+            case Ok(msg):
+                print(f"Successfully set LED {led_num}: {msg}")
             case Err(msg):
                 exit_with_error(msg)
+            case _:
+                raise RuntimeError("Missing case statement")
     if args.gui_image:
         value = args.gui_image[0]
-        match get_device(device_index, devices):
-            case Ok(device):
-                print(f"Showing Image {value}...")
-                match device.show_gui_image(value):
-                    case Ok(msg):
-                        print(f"Successfully showing {value}: {msg}")
-                    case Err(msg):
-                        exit_with_error(f"Failed to show Image {msg}")
+        print(f"Showing Image {value}...")
+        match selected_device().show_gui_image(value):
+            case Ok(msg):
+                print(f"Successfully showing {value}: {msg}")
             case Err(msg):
-                exit_with_error(msg)
+                exit_with_error(f"Failed to show Image {msg}")
     if args.gui_text:
         value = args.gui_text[0]
-        match get_device(device_index, devices):
-            case Ok(device):
-                print(f"Showing text {value}...")
-                match device.show_text_display(value):
-                    case Ok(msg):
-                        print(f"Successfully showing {value}: {msg}")
-                    case Err(msg):
-                        exit_with_error(f"Failed to show text {msg}")
+        print(f"Showing text {value}...")
+        match selected_device().show_text_display(value):
+            case Ok(msg):
+                print(f"Successfully showing {value}: {msg}")
             case Err(msg):
-                exit_with_error(msg)
+                exit_with_error(f"Failed to show text {msg}")
     if args.read_buttons:
-        match get_device(device_index, devices):
-            case Ok(device):
-                print("Getting button values...")
-                match device.read_all_buttons():
-                    case Ok(buttons):
-                        for button_color, button_state in buttons.items():
-                            msg = f"\N{WHITE HEAVY CHECK MARK} {button_color.name} Pressed"
-                            if button_state == 0:
-                                msg = f"\N{CROSS MARK} {button_color.name} Released"
-                            print(msg)
-                    case Err(msg):
-                        exit_with_error(f"Failed to get button values {msg}")
+        print("Getting button values...")
+        match selected_device().read_all_buttons():
+            case Ok(buttons):
+                for button_color, button_state in buttons.items():
+                    msg = f"\N{WHITE HEAVY CHECK MARK} {button_color.name} Pressed"
+                    if button_state == 0:
+                        msg = f"\N{CROSS MARK} {button_color.name} Released"
+                    print(msg)
             case Err(msg):
-                exit_with_error(msg)
+                exit_with_error(f"Failed to get button values {msg}")
     if args.reset_display:
-        match get_device(device_index, devices):
-            case Ok(device):
-                print("Resetting display...")
-                match device.reset_display():
-                    case Ok(msg):
-                        print(f"Successfully reset display: {msg}")
-                    case Err(msg):
-                        exit_with_error(f"Failed to reset display {msg}")
-                    case Err(msg):
-                        exit_with_error(msg)
+        print("Resetting display...")
+        match selected_device().reset_display():
+            case Ok(msg):
+                print(f"Successfully reset display: {msg}")
             case Err(msg):
-                exit_with_error(msg)
+                exit_with_error(f"Failed to reset display {msg}")
     if args.radio_index:
         value = args.radio_index[0]
-        match get_device(device_index, devices):
-            case Ok(device):
-                print(f"Selecting radio index {value}...")
-                match device.select_radio(value):
-                    case Ok(msg):
-                        print(f"Successfully selected radio index {value}: {msg}")
-                    case Err(msg):
-                        exit_with_error(f"Failed to select radio index {value}: {msg}")
+        print(f"Selecting radio index {value}...")
+        match selected_device().select_radio(value):
+            case Ok(msg):
+                print(f"Successfully selected radio index {value}: {msg}")
             case Err(msg):
-                exit_with_error(msg)
+                exit_with_error(f"Failed to select radio index {value}: {msg}")
     if args.radio_file:
         value = args.radio_file[0]
-        match get_device(device_index, devices):
-            case Ok(device):
-                print(f"Showing radio file {value}...")
-                match device.transmit_radio_subfile(value):
-                    case Ok(msg):
-                        print(f"Successfully transmitting {value}: {msg}")
-                    case Err(msg):
-                        exit_with_error(f"Failed to transmit radio file {value}: {msg}")
+        print(f"Showing radio file {value}...")
+        match selected_device().transmit_radio_subfile(value):
+            case Ok(msg):
+                print(f"Successfully transmitting {value}: {msg}")
             case Err(msg):
-                exit_with_error(msg)
+                exit_with_error(f"Failed to transmit radio file {value}: {msg}")
     if args.reset_software:
-        match get_device(device_index, devices):
-            case Ok(device):
-                print("Resetting software...")
-                match device.reset_software(FreeWiliProcessorType.Main if not processor_type else processor_type):
-                    case Ok(msg):
-                        print(f"Successfully reset software: {msg}")
-                    case Err(msg):
-                        exit_with_error(f"Failed to reset software {msg}")
-                    case Err(msg):
-                        exit_with_error(msg)
+        print("Resetting software...")
+        match selected_device().reset_software(FreeWiliProcessorType.Main if not processor_type else processor_type):
+            case Ok(msg):
+                print(f"Successfully reset software: {msg}")
             case Err(msg):
-                exit_with_error(msg)
+                exit_with_error(f"Failed to reset software {msg}")
 
 
 if __name__ == "__main__":
@@ -4,15 +4,19 @@ import enum
 import re
 import sys
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
     from typing_extensions import Self
 
-import numpy as np
 from result import Err, Ok, Result
 
+if TYPE_CHECKING:
+    # numpy is slow to import, only load it when a timestamp is converted.
+    import numpy as np
+
 
 class ResponseFrameType(enum.Enum):
     """FreeWili serial response frame types."""
@@ -240,7 +244,7 @@ class ResponseFrame:
         except ValueError as ex:
             return Err(str(ex))
 
-    def timestamp_as_datetime(self, check_ok: bool = False) -> Result[np.datetime64, str]:
+    def timestamp_as_datetime(self, check_ok: bool = False) -> Result["np.datetime64", str]:
         """Convert the timestamp into a datetime.
 
         Parameters:
@@ -253,6 +257,8 @@ class ResponseFrame:
             Result[np.datetime64, str]:
                 Ok(np.datetime64) if valid, Err(str) if timestamp couldn't be converted.
         """
+        import numpy as np
+
         if check_ok and not self.is_ok():
             return Err("Response success is not ok")
         return Ok(np.datetime64(self.timestamp, "ns"))
@@ -1,10 +1,12 @@
 """For Interfacing to Free-Wili Devices."""
 
 import datetime
+import functools
 import pathlib
-import platform
 import sys
+import time
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Callable, List
 
 if sys.version_info >= (3, 11):
@@ -27,6 +29,11 @@ DISPLAY_HUB_LOC_INDEX = 1
 # third address = Main
 MAIN_HUB_LOC_INDEX = 0
 
+# Seconds a USB enumeration result is reused by FreeWili.find_all()
+_CACHE_TTL = 2.0
+# Last non-empty enumeration: (time.monotonic() timestamp, devices), None when invalidated
+_ENUM_CACHE: None | tuple[float, tuple[fwf.FreeWiliDevice, ...]] = None
+
 
 class FreeWili:
     """Free-Wili device used to access FTDI and serial functionality."""
@@ -97,7 +104,7 @@ class FreeWili:
         """Grab all the USB devices attached to the FreeWili."""
         return self.device.usb_devices
 
-    @property
+    @functools.cached_property
     def hub(self) -> None | fwf.USBDevice:
         """Get the Hub USB Device.
 
@@ -110,7 +117,7 @@ class FreeWili:
         except Exception as _e:
             return None
 
-    @property
+    @functools.cached_property
     def fpga(self) -> None | fwf.USBDevice:
         """Get the FPGA USB Device.
 
@@ -123,7 +130,7 @@ class FreeWili:
         except Exception as _e:
             return None
 
-    @property
+    @functools.cached_property
     def main(self) -> None | fwf.USBDevice:
         """Get the Main USB Device.
 
@@ -136,7 +143,7 @@ class FreeWili:
         except Exception as _e:
             return None
 
-    @property
+    @functools.cached_property
     def display(self) -> None | fwf.USBDevice:
         """Get the Display USB Device.
 
@@ -263,12 +270,15 @@ class FreeWili:
             self.display_serial.close()
 
     @classmethod
-    def find_first(cls) -> Result[Self, str]:
+    def find_first(cls, use_cache: bool = False) -> Result[Self, str]:
         """Find first Free-Wili device attached to the host.
 
+        Uses find_all(), see it for how use_cache behaves.
+
         Parameters:
         ------------
-            None
+            use_cache: bool
+                Reuse a recent USB scan if available. Defaults to False which always rescans the host.
 
         Returns:
         ---------
@@ -280,7 +290,7 @@ class FreeWili:
             None
         """
         try:
-            devices = cls.find_all()
+            devices = cls.find_all(use_cache)
             if not devices:
                 return Err("No FreeWili devices found!")
             return Ok(devices[0])
@@ -288,12 +298,17 @@ class FreeWili:
             return Err(str(ex))
 
     @classmethod
-    def find_all(cls) -> tuple[Self, ...]:
+    def find_all(cls, use_cache: bool = False) -> tuple[Self, ...]:
         """Find all Free-Wili devices attached to the host.
 
+        With use_cache, a non-empty scan younger than _CACHE_TTL seconds is reused instead of rescanning
+        the host. This is opt-in for callers that enumerate repeatedly in a short window. Empty scans are
+        never cached and resetting a FreeWili clears the cache (see invalidate_cache()).
+
         Parameters:
         ------------
-            None
+            use_cache: bool
+                Reuse a recent USB scan if available. Defaults to False which always rescans the host.
 
         Returns:
         ---------
@@ -304,12 +319,34 @@ class FreeWili:
         -------
             None
         """
-        found_devices: List[fwf.FreeWiliDevice] = fwf.find_all()
+        global _ENUM_CACHE
+        # USB enumeration is slow (seconds on Windows), only rescan once the TTL expires.
+        if use_cache and _ENUM_CACHE is not None and time.monotonic() - _ENUM_CACHE[0] < _CACHE_TTL:
+            found_devices = _ENUM_CACHE[1]
+        else:
+            found_devices = tuple(fwf.find_all())
+            # Don't cache empty scans, a board that was just plugged in or reset should show up right away.
+            _ENUM_CACHE = (time.monotonic(), found_devices) if found_devices else None
         fw_devices: list[Self] = []
         for device in found_devices:
             fw_devices.append(cls(device))
         return tuple(fw_devices)
 
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Discard cached USB enumeration results so the next find_all() rescans the host.
+
+        Parameters:
+        ------------
+            None
+
+        Returns:
+        ---------
+            None
+        """
+        global _ENUM_CACHE
+        _ENUM_CACHE = None
+
     def send_file(
         self,
         source_file: str | pathlib.Path,
@@ -339,12 +376,16 @@ class FreeWili:
             Result[str, str]:
                 Returns Ok(str) if the command was sent successfully, Err(str) if not.
         """
+        # Convert once, FreeWiliSerial.send_file takes the same Path without re-parsing it
+        fpath = pathlib.Path(source_file)
         try:
             # Auto assign values that are None
-            if not target_name:
-                target_name = FileMap.from_fname(str(source_file)).to_path(str(source_file))
-            if not processor:
-                processor = FileMap.from_fname(str(source_file)).processor
+            if not target_name or not processor:
+                file_map = FileMap.from_path(fpath)
+                if not target_name:
+                    target_name = file_map.to_path(fpath)
+                if not processor:
+                    processor = file_map.processor
         except ValueError as ex:
             return Err(str(ex))
         assert target_name is not None
@@ -352,7 +393,7 @@ class FreeWili:
 
         match self.get_serial_from(processor):
             case Ok(serial):
-                return serial.send_file(source_file, target_name, event_cb, chunk_size)
+                return serial.send_file(fpath, target_name, event_cb, chunk_size)
             case Err(msg):
                 return Err(msg)
             case _:
@@ -387,7 +428,7 @@ class FreeWili:
         try:
             # Auto assign values that are None
             if not processor:
-                processor = FileMap.from_fname(str(source_file)).processor
+                processor = FileMap.from_fname(source_file).processor
         except ValueError as ex:
             return Err(str(ex))
         match self.get_serial_from(processor):
@@ -413,7 +454,10 @@ class FreeWili:
         """
         match self.get_serial_from(processor):
             case Ok(serial):
-                return serial.reset_software()
+                result = serial.reset_software()
+                # The board re-enumerates after a reset, any cached scan is stale now.
+                self.invalidate_cache()
+                return result
             case Err(msg):
                 return Err(msg)
             case _:
@@ -1535,7 +1579,10 @@ class FreeWili:
         """
         match self.get_serial_from(processor):
             case Ok(serial):
-                return serial.reset_to_uf2_bootloader()
+                result = serial.reset_to_uf2_bootloader()
+                # The board re-enumerates as a UF2 device, any cached scan is stale now.
+                self.invalidate_cache()
+                return result
             case Err(msg):
                 return Err(msg)
             case _:
@@ -2274,7 +2321,30 @@ class FreeWili:
                 raise RuntimeError("Missing case statement")
 
 
-@dataclass(frozen=True)
+# Lower case file extension (without the dot) -> (processor, directory, description)
+_EXT_MAP: MappingProxyType[str, tuple[FreeWiliProcessorType, str, str]] = MappingProxyType(
+    {
+        "wasm": (FreeWiliProcessorType.Main, "/scripts", "WASM binary"),
+        "wsm": (FreeWiliProcessorType.Main, "/scripts", "WASM binary"),
+        "zio": (FreeWiliProcessorType.Main, "/scripts", "ZoomIO script file"),
+        "bin": (FreeWiliProcessorType.Main, "/fpga", "FPGA bin file"),
+        "sub": (FreeWiliProcessorType.Main, "/radio", "Radio file"),
+        "fwi": (FreeWiliProcessorType.Display, "/images", "Image file"),
+        "wav": (FreeWiliProcessorType.Display, "/sounds", "Audio file"),
+        "py": (FreeWiliProcessorType.Main, "/scripts", "rthon script"),
+    }
+)
+# Common spellings ("wasm", "WASM", ".wasm", ".WASM") -> (extension, processor, directory, description)
+_EXT_MAP_FULL: MappingProxyType[str, tuple[str, FreeWiliProcessorType, str, str]] = MappingProxyType(
+    {
+        variant: (ext,) + vals
+        for ext, vals in _EXT_MAP.items()
+        for variant in (ext, ext.upper(), f".{ext}", f".{ext.upper()}")
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
 class FileMap:
     """Map file extension to processor type and location."""
 
@@ -2305,20 +2375,14 @@ class FileMap:
             ValueError:
                 If the extension isn't known.
         """
-        ext = ext.lstrip(".").lower()
-        mappings = {
-            "wasm": (FreeWiliProcessorType.Main, "/scripts", "WASM binary"),
-            "wsm": (FreeWiliProcessorType.Main, "/scripts", "WASM binary"),
-            "zio": (FreeWiliProcessorType.Main, "/scripts", "ZoomIO script file"),
-            "bin": (FreeWiliProcessorType.Main, "/fpga", "FPGA bin file"),
-            "sub": (FreeWiliProcessorType.Main, "/radio", "Radio file"),
-            "fwi": (FreeWiliProcessorType.Display, "/images", "Image file"),
-            "wav": (FreeWiliProcessorType.Display, "/sounds", "Audio file"),
-            "py": (FreeWiliProcessorType.Main, "/scripts", "rthon script"),
-        }
-        if ext not in mappings:
-            raise ValueError(f"Extension '{ext}' is not a known FreeWili file type")
-        return cls(ext, *mappings[ext])
+        vals = _EXT_MAP_FULL.get(ext)
+        if vals is None:
+            # Mixed case or unknown, normalize and try again
+            ext = ext.lstrip(".").lower()
+            vals = _EXT_MAP_FULL.get(ext)
+            if vals is None:
+                raise ValueError(f"Extension '{ext}' is not a known FreeWili file type")
+        return cls(*vals)
 
     @classmethod
     def from_fname(cls, file_name: str) -> Self:
@@ -2338,15 +2402,34 @@ class FileMap:
             ValueError:
                 If the extension isn't known.
         """
-        fpath = pathlib.Path(file_name)
+        return cls.from_path(pathlib.Path(file_name))
+
+    @classmethod
+    def from_path(cls, fpath: pathlib.PurePath) -> Self:
+        """Creates a FileMap from an already constructed path.
+
+        Parameters:
+        ------------
+            fpath: pathlib.PurePath
+                File path (ie. pathlib.Path("myfile.wasm")). Not case sensitive.
+
+        Returns:
+        ---------
+            FileMap
+
+        Raises:
+        -------
+            ValueError:
+                If the extension isn't known.
+        """
         return cls.from_ext(fpath.suffix)
 
-    def to_path(self, file_name: str) -> str:
+    def to_path(self, file_name: str | pathlib.PurePath) -> str:
         """Creates a file path from the file_name to upload to the FreeWili.
 
         Parameters:
         ------------
-            file_name: str
+            file_name: str | pathlib.PurePath
                 File name (ie. "myfile.wasm"). Not case sensitive. Can contain paths.
 
         Returns:
@@ -2359,8 +2442,6 @@ class FileMap:
             ValueError:
                 If the extension isn't known.
         """
-        fpath = pathlib.Path(file_name)
-        fpath_str = str(pathlib.Path(self.directory) / fpath.name)
-        if platform.system().lower() == "windows":
-            fpath_str = fpath_str.replace("\\", "/")
-        return fpath_str
+        fpath = file_name if isinstance(file_name, pathlib.PurePath) else pathlib.Path(file_name)
+        # FreeWili paths are always POSIX style, no need to go through the host's path flavour.
+        return f"{self.directory}/{fpath.name}"
@@ -25,7 +25,6 @@ else:
     from typing_extensions import Self
 
 import serial
-import serial.tools.list_ports
 from result import Err, Ok, Result
 
 from freewili.types import ButtonColor, EventType, FileSystemContents, FreeWiliProcessorType, IOMenuCommand
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+from typing import Iterator
+
+import pytest
+
+from freewili.fw import FreeWili
+
+
+@pytest.fixture(autouse=True)
+def _clear_freewili_enumeration_cache() -> Iterator[None]:
+    """Keep FreeWili.find_all() results from leaking between tests."""
+    FreeWili.invalidate_cache()
+    yield
+    FreeWili.invalidate_cache()
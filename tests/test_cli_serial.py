@@ -0,0 +1,64 @@
+"""Tests for freewili.cli_serial module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from result import Ok
+
+from freewili.cli import get_device
+from freewili.cli_serial import main
+from freewili.fw import FreeWili
+
+
+class TestMain:
+    """Test cases for the main function."""
+
+    def test_main_list_no_devices(self) -> None:
+        """Test listing when no FreeWili is connected."""
+        test_args = ["fwi-serial", "--list"]
+
+        with (
+            patch("sys.argv", test_args),
+            patch("pyfwfinder.find_all", return_value=[]),
+            patch("freewili.cli.get_device") as mock_get_device,
+            patch("builtins.print") as mock_print,
+        ):
+            main()
+
+            mock_print.assert_called_once_with("Found 0 FreeWili(s)")
+            mock_get_device.assert_not_called()
+
+    def test_main_send_and_run_share_device_lookup(self) -> None:
+        """Test -s and -w use a single device lookup."""
+        test_args = ["fwi-serial", "-s", "path/to/script.wasm", "-w"]
+
+        with (
+            patch("sys.argv", test_args),
+            patch("pyfwfinder.find_all", return_value=[MagicMock()]),
+            patch("freewili.cli.get_device", wraps=get_device) as mock_get_device,
+            patch.object(FreeWili, "send_file", return_value=Ok("sent")) as mock_send_file,
+            patch.object(FreeWili, "run_script", return_value=Ok("running")) as mock_run_script,
+            patch("builtins.print"),
+        ):
+            main()
+
+            mock_get_device.assert_called_once()
+            mock_send_file.assert_called_once()
+            assert mock_send_file.call_args.args[0] == "path/to/script.wasm"
+            mock_run_script.assert_called_once_with("script.wasm", True)
+
+    def test_main_index_out_of_range(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test an out of range -i exits with the get_device error."""
+        test_args = ["fwi-serial", "-i", "3", "-rd"]
+
+        with (
+            patch("sys.argv", test_args),
+            patch("pyfwfinder.find_all", return_value=[MagicMock()]),
+            patch.object(FreeWili, "reset_display") as mock_reset_display,
+        ):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+            assert exc_info.value.code == 1
+            mock_reset_display.assert_not_called()
+        assert "Index 2 is out of range. There are only 1 devices." in capsys.readouterr().err
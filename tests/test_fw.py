@@ -1,10 +1,12 @@
 """Test code for freewili.fw module."""
 
 import os
+import pathlib
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
+from result import Ok
 
 from freewili.fw import FileMap, FreeWili
 from freewili.fw_serial import FreeWiliProcessorType
@@ -30,6 +32,10 @@ def test_file_mappings() -> None:
         assert map.directory == values[1]
         assert map.description == values[2]
 
+    for ext in (".wasm", "WASM", ".WASM", ".Wasm", "..wasm"):
+        assert FileMap.from_ext(ext) == FileMap.from_ext("wasm")
+        assert FileMap.from_ext(ext).extension == "wasm"
+
     with pytest.raises(ValueError, match="Extension 'failure' is not a known FreeWili file type") as _exc_info:
         FileMap.from_ext(".failure")
 
@@ -82,6 +88,77 @@ def test_freewili_find_first_success() -> None:
         assert fw.device == mock_device
 
 
+def test_freewili_find_all_cache() -> None:
+    """Test FreeWili find_all reuses enumeration results only when asked to."""
+    mock_device = MagicMock()
+    mock_device.serial = "MOCK123"
+
+    with patch("pyfwfinder.find_all", return_value=[mock_device]) as mock_find_all:
+        # Default always rescans
+        assert len(FreeWili.find_all()) == 1
+        assert len(FreeWili.find_all()) == 1
+        assert mock_find_all.call_count == 2
+
+        # Opt in reuses the last scan
+        assert len(FreeWili.find_all(use_cache=True)) == 1
+        assert FreeWili.find_first(use_cache=True).is_ok()
+        assert mock_find_all.call_count == 2
+
+        FreeWili.invalidate_cache()
+        assert len(FreeWili.find_all(use_cache=True)) == 1
+        assert mock_find_all.call_count == 3
+
+        # Expired entries trigger a rescan
+        with patch("freewili.fw._CACHE_TTL", 0.0):
+            FreeWili.find_all(use_cache=True)
+        assert mock_find_all.call_count == 4
+
+
+def test_freewili_find_all_empty_not_cached() -> None:
+    """Test FreeWili find_all rescans when no devices were found."""
+    with patch("pyfwfinder.find_all", return_value=[]) as mock_find_all:
+        assert FreeWili.find_all(use_cache=True) == ()
+        assert FreeWili.find_first(use_cache=True).is_err()
+        assert mock_find_all.call_count == 2
+
+
+def test_freewili_reset_invalidates_cache() -> None:
+    """Test find_all rescans after a FreeWili is reset."""
+    mock_device = MagicMock()
+    mock_device.serial = "MOCK123"
+    mock_serial = MagicMock()
+    mock_serial.reset_to_uf2_bootloader.return_value = Ok(None)
+    mock_serial.reset_software.return_value = Ok("reset")
+
+    with patch("pyfwfinder.find_all", return_value=[mock_device]) as mock_find_all:
+        fw = FreeWili.find_first(use_cache=True).unwrap()
+        assert mock_find_all.call_count == 1
+
+        with patch.object(FreeWili, "get_serial_from", return_value=Ok(mock_serial)):
+            assert fw.reset_to_uf2_bootloader(FreeWiliProcessorType.Main).is_ok()
+            FreeWili.find_all(use_cache=True)
+            assert mock_find_all.call_count == 2
+
+            assert fw.reset_software().is_ok()
+            FreeWili.find_all(use_cache=True)
+            assert mock_find_all.call_count == 3
+
+
+def test_freewili_usb_device_lookup_cached() -> None:
+    """Test FreeWili only queries pyfwfinder once per USB device."""
+    mock_device = MagicMock()
+    mock_device.get_display_usb_device.side_effect = RuntimeError("No display")
+    fw = FreeWili(mock_device)
+
+    assert fw.main is mock_device.get_main_usb_device.return_value
+    assert fw.main is mock_device.get_main_usb_device.return_value
+    assert mock_device.get_main_usb_device.call_count == 1
+
+    assert fw.display is None
+    assert fw.display is None
+    assert mock_device.get_display_usb_device.call_count == 1
+
+
 def test_file_map_invalid_extension() -> None:
     """Test FileMap with invalid extension."""
     with pytest.raises(ValueError) as exc_info:
@@ -96,9 +173,11 @@ def test_file_map_invalid_extension() -> None:
     assert FileMap.from_fname(r"C:\dev\My Project\Output\test.wasm") == FileMap.from_ext("wasm")
     assert FileMap.from_fname(r"/home/dev/my_project/test.wasm") == FileMap.from_ext("wasm")
     assert FileMap.from_fname(r"test.wasm") == FileMap.from_ext("wasm")
+    assert FileMap.from_path(pathlib.Path("test.wasm")) == FileMap.from_ext("wasm")
 
     assert FileMap.from_ext("wasm").to_path("test.wasm") == "/scripts/test.wasm"
     assert FileMap.from_ext("wasm").to_path("/some/random/path/test.wasm") == "/scripts/test.wasm"
+    assert FileMap.from_ext("wasm").to_path(pathlib.Path("/some/random/path/test.wasm")) == "/scripts/test.wasm"
 
 
 @pytest.mark.skipif("len(FreeWili.find_all()) == 0")